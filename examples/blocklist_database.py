@@ -31,8 +31,8 @@ db = SQLAlchemy(app)
 # Making jti an index can significantly speed up the search when there are
 # tens of thousands of records. Remember this query will happen for every
 # (protected) request,
-# If your database supports a UUID type, this can be used for the jti column
-# as well
+# The jti is an opaque 32 character hex string, so a String(32) or String(36)
+# column fits it
 class TokenBlocklist(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     jti = db.Column(db.String(36), nullable=False, index=True)
@@ -23,13 +23,31 @@ jwt_redis_blocklist = redis.StrictRedis(
     host="localhost", port=6379, db=0, decode_responses=True
 )
 
+# Optionally, if your redis server is version 7.4 or newer (and you are using
+# redis-py 5.1+), you can enable client side caching so that repeated lookups
+# for the same JWT are answered from local memory. Redis notifies the client to
+# drop a cached entry when its key changes, such as when another worker revokes
+# the JWT. Against older servers redis-py raises a ConnectionError instead.
+#
+#   from redis.cache import CacheConfig
+#
+#   jwt_redis_blocklist = redis.StrictRedis(
+#       host="localhost",
+#       port=6379,
+#       db=0,
+#       decode_responses=True,
+#       protocol=3,
+#       cache_config=CacheConfig(),
+#   )
 
-# Callback function to check if a JWT exists in the redis blocklist
+
+# Callback function to check if a JWT exists in the redis blocklist. EXISTS is
+# used rather than GET as client side caching does not cache a missing (None)
+# reply, which is the common case of a JWT that has not been revoked.
 @jwt.token_in_blocklist_loader
 def check_if_token_is_revoked(jwt_header, jwt_payload: dict):
     jti = jwt_payload["jti"]
-    token_in_redis = jwt_redis_blocklist.get(jti)
-    return token_in_redis is not None
+    return jwt_redis_blocklist.exists(jti) == 1
 
 
 @app.route("/login", methods=["POST"])
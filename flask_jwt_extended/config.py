@@ -15,6 +15,8 @@ from jwt.algorithms import requires_cryptography
 from flask_jwt_extended.internal_utils import get_json_encoder
 from flask_jwt_extended.typing import ExpiresDelta
 
+_EXEMPT_METHODS = frozenset(("OPTIONS",))
+
 
 class _Config(object):
     """
@@ -187,7 +189,7 @@ class _Config(object):
         delta = current_app.config["JWT_ACCESS_TOKEN_EXPIRES"]
         if type(delta) is int:
             delta = timedelta(seconds=delta)
-        if delta is not False:
+        if delta is not False and not isinstance(delta, timedelta):
             try:
                 # Basically runtime typechecking. Probably a better way to do
                 # this with proper type checking
@@ -204,7 +206,7 @@ class _Config(object):
         delta = current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
         if type(delta) is int:
             delta = timedelta(seconds=delta)
-        if delta is not False:
+        if delta is not False and not isinstance(delta, timedelta):
             # Basically runtime typechecking. Probably a better way to do
             # this with proper type checking
             try:
@@ -277,7 +279,7 @@ class _Config(object):
 
     @property
     def exempt_methods(self) -> Iterable[str]:
-        return {"OPTIONS"}
+        return _EXEMPT_METHODS
 
     @property
     def error_msg_key(self) -> str:
@@ -303,6 +305,10 @@ class _Config(object):
     def decode_issuer(self) -> str:
         return current_app.config["JWT_DECODE_ISSUER"]
 
+    @property
+    def decode_cache_size(self) -> int:
+        return current_app.config["JWT_DECODE_CACHE_SIZE"]
+
     @property
     def leeway(self) -> int:
         return current_app.config["JWT_DECODE_LEEWAY"]
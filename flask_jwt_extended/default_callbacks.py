@@ -7,15 +7,20 @@ http://flask-jwt-extended.readthedocs.io/en/latest/changing_default_behavior.htm
 http://flask-jwt-extended.readthedocs.io/en/latest/tokens_from_complex_object.html
 """
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any
+from typing import Mapping
 
 from flask import jsonify
 from flask.typing import ResponseReturnValue
 
 from flask_jwt_extended.config import config
 
+# Shared, read only result for the default additional claims callback
+_NO_ADDITIONAL_CLAIMS: Mapping[str, Any] = MappingProxyType({})
 
-def default_additional_claims_callback(userdata: Any) -> dict:
+
+def default_additional_claims_callback(userdata: Any) -> Mapping[str, Any]:
     """
     By default, we add no additional claims to the access tokens.
 
@@ -23,7 +28,7 @@ def default_additional_claims_callback(userdata: Any) -> dict:
                      ```create_access_token``` and ```create_refresh_token```
                      functions
     """
-    return {}
+    return _NO_ADDITIONAL_CLAIMS
 
 
 def default_blocklist_callback(jwt_headers: dict, jwt_data: dict) -> bool:
@@ -2,6 +2,7 @@ import datetime
 from typing import Any
 from typing import Callable
 from typing import Optional
+from typing import Tuple
 
 import jwt
 from flask import Flask
@@ -41,6 +42,7 @@ from flask_jwt_extended.exceptions import UserLookupError
 from flask_jwt_extended.exceptions import WrongTokenError
 from flask_jwt_extended.tokens import _decode_jwt
 from flask_jwt_extended.tokens import _encode_jwt
+from flask_jwt_extended.tokens import _VerifiedTokenCache
 from flask_jwt_extended.typing import ExpiresDelta
 from flask_jwt_extended.typing import Fresh
 from flask_jwt_extended.utils import current_user_context_processor
@@ -91,6 +93,9 @@ class JWTManager(object):
             default_token_verification_failed_callback
         )
 
+        # Tokens which have already passed signature verification
+        self._verified_token_cache = _VerifiedTokenCache()
+
         # Register this extension with the flask app now (if it is provided)
         if app is not None:
             self.init_app(app, add_context_processor)
@@ -204,6 +209,7 @@ class JWTManager(object):
         app.config.setdefault("JWT_CSRF_METHODS", ["POST", "PUT", "PATCH", "DELETE"])
         app.config.setdefault("JWT_DECODE_ALGORITHMS", None)
         app.config.setdefault("JWT_DECODE_AUDIENCE", None)
+        app.config.setdefault("JWT_DECODE_CACHE_SIZE", 1024)
         app.config.setdefault("JWT_DECODE_ISSUER", None)
         app.config.setdefault("JWT_DECODE_LEEWAY", 0)
         app.config.setdefault("JWT_ENCODE_AUDIENCE", None)
@@ -498,13 +504,15 @@ class JWTManager(object):
         expires_delta: Optional[ExpiresDelta] = None,
         headers=None,
     ) -> str:
+        # Merge into new dicts rather than updating the ones returned by the
+        # callbacks, which may be shared (the default callback returns a constant)
         header_overrides = self._jwt_additional_header_callback(identity)
         if headers is not None:
-            header_overrides.update(headers)
+            header_overrides = {**header_overrides, **headers}
 
         claim_overrides = self._user_claims_callback(identity)
         if claims is not None:
-            claim_overrides.update(claims)
+            claim_overrides = {**claim_overrides, **claims}
 
         if expires_delta is None:
             if token_type == "access":
@@ -532,29 +540,47 @@ class JWTManager(object):
     def _decode_jwt_from_config(
         self, encoded_token: str, csrf_value=None, allow_expired: bool = False
     ) -> dict:
-        unverified_claims = jwt.decode(
+        return self._decode_jwt_and_header_from_config(
+            encoded_token, csrf_value, allow_expired
+        )[1]
+
+    def _decode_jwt_and_header_from_config(
+        self, encoded_token: str, csrf_value=None, allow_expired: bool = False
+    ) -> Tuple[dict, dict]:
+        # Returns (header, payload). The header is the one parsed here to look
+        # up the decode key, so callers don't need to parse it a second time.
+        # Each config option is looked up through current_app, so only do so once
+        algorithms = config.decode_algorithms
+        audience = config.decode_audience
+
+        # Parse the header and payload in a single pass to look up the decode key
+        unverified = jwt.api_jwt.decode_complete(
             encoded_token,
-            algorithms=config.decode_algorithms,
+            algorithms=algorithms,
             options={"verify_signature": False},
         )
-        unverified_headers = jwt.get_unverified_header(encoded_token)
+        unverified_claims = unverified["payload"]
+        unverified_headers = unverified["header"]
         secret = self._decode_key_callback(unverified_headers, unverified_claims)
 
         kwargs = {
-            "algorithms": config.decode_algorithms,
-            "audience": config.decode_audience,
+            "algorithms": algorithms,
+            "audience": audience,
             "csrf_value": csrf_value,
             "encoded_token": encoded_token,
             "identity_claim_key": config.identity_claim_key,
             "issuer": config.decode_issuer,
             "leeway": config.leeway,
             "secret": secret,
-            "verify_aud": config.decode_audience is not None,
+            "verify_aud": audience is not None,
             "verify_sub": config.verify_sub,
+            "verified_cache": self._verified_token_cache,
+            "verified_cache_size": config.decode_cache_size,
+            "unverified_claims": unverified_claims,
         }
 
         try:
-            return _decode_jwt(**kwargs, allow_expired=allow_expired)
+            decoded_token = _decode_jwt(**kwargs, allow_expired=allow_expired)
         except ExpiredSignatureError as e:
             # TODO: If we ever do another breaking change, don't raise this pyjwt
             #       error directly, instead raise a custom error of ours from this
@@ -562,3 +588,5 @@ class JWTManager(object):
             e.jwt_header = unverified_headers  # type: ignore
             e.jwt_data = _decode_jwt(**kwargs, allow_expired=True)  # type: ignore
             raise
+
+        return unverified_headers, decoded_token
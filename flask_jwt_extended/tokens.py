@@ -1,12 +1,19 @@
-import uuid
+from collections import OrderedDict
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from hashlib import sha256
 from hmac import compare_digest
 from json import JSONEncoder
+from secrets import token_hex
+from threading import Lock
+from time import time
 from typing import Any
+from typing import Hashable
 from typing import Iterable
 from typing import List
+from typing import Mapping
+from typing import Optional
 from typing import Type
 from typing import Union
 
@@ -21,7 +28,7 @@ from flask_jwt_extended.typing import Fresh
 def _encode_jwt(
     algorithm: str,
     audience: Union[str, Iterable[str]],
-    claim_overrides: dict,
+    claim_overrides: Mapping[str, Any],
     csrf: bool,
     expires_delta: ExpiresDelta,
     fresh: Fresh,
@@ -34,24 +41,27 @@ def _encode_jwt(
     token_type: str,
     nbf: bool,
 ) -> str:
-    now = datetime.now(timezone.utc)
+    # Registered claims are stored as integer timestamps, which saves PyJWT from
+    # converting a datetime object for each of them.
+    now = time()
+    now_ts = int(now)
 
     if isinstance(fresh, timedelta):
-        fresh = datetime.timestamp(now + fresh)
+        fresh = now + fresh.total_seconds()
 
     token_data = {
         "fresh": fresh,
-        "iat": now,
-        "jti": str(uuid.uuid4()),
+        "iat": now_ts,
+        "jti": token_hex(16),
         "type": token_type,
         identity_claim_key: identity,
     }
 
     if nbf:
-        token_data["nbf"] = now
+        token_data["nbf"] = now_ts
 
     if csrf:
-        token_data["csrf"] = str(uuid.uuid4())
+        token_data["csrf"] = token_hex(16)
 
     if audience:
         token_data["aud"] = audience
@@ -60,7 +70,13 @@ def _encode_jwt(
         token_data["iss"] = issuer
 
     if expires_delta:
-        token_data["exp"] = now + expires_delta
+        if isinstance(expires_delta, timedelta):
+            token_data["exp"] = now_ts + int(expires_delta.total_seconds())
+        else:
+            # Other deltas (such as a dateutil relativedelta) need calendar math
+            token_data["exp"] = (
+                datetime.fromtimestamp(now, timezone.utc) + expires_delta
+            )
 
     if claim_overrides:
         token_data.update(claim_overrides)
@@ -74,6 +90,75 @@ def _encode_jwt(
     )
 
 
+class _VerifiedTokenCache(object):
+    """
+    A bounded, thread safe LRU of encoded JWTs whose signature and registered
+    claims have already been verified. Only the expiration time of a token is
+    kept, the payload always comes from the caller's own parse of the token so
+    that callers never share a mutable claims dict between requests.
+    """
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Hashable, Optional[float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, key: Hashable, leeway: Union[float, timedelta]) -> bool:
+        if isinstance(leeway, timedelta):
+            leeway = leeway.total_seconds()
+
+        with self._lock:
+            try:
+                exp = self._entries[key]
+            except KeyError:
+                return False
+
+            # Mirror the PyJWT expiration check, so an expired token falls
+            # through to a full decode which raises the appropriate error.
+            if exp is not None and exp <= time() - leeway:
+                del self._entries[key]
+                return False
+
+            self._entries.move_to_end(key)
+            return True
+
+    def add(self, key: Hashable, exp: Optional[float], maxsize: int) -> None:
+        with self._lock:
+            self._entries[key] = exp
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, set)):
+        return tuple(value)
+    return value
+
+
+def _token_digest(encoded_token: Union[str, bytes]) -> bytes:
+    # Key the cache on a fixed size digest, as JWTs can be several KB each
+    if isinstance(encoded_token, str):
+        encoded_token = encoded_token.encode("utf-8")
+    return sha256(encoded_token).digest()
+
+
+def _verified_cache_key(*args: Any) -> Optional[Hashable]:
+    key = tuple(_freeze(arg) for arg in args)
+    try:
+        hash(key)
+    except TypeError:
+        # Keys or decode options which cannot be hashed bypass the cache
+        return None
+    return key
+
+
 def _decode_jwt(
     algorithms: List,
     allow_expired: bool,
@@ -86,35 +171,62 @@ def _decode_jwt(
     secret: str,
     verify_aud: bool,
     verify_sub: bool,
+    verified_cache: Optional[_VerifiedTokenCache] = None,
+    verified_cache_size: int = 0,
+    unverified_claims: Optional[dict] = None,
 ) -> dict:
     options = {"verify_aud": verify_aud, "verify_sub": verify_sub}
     if allow_expired:
         options["verify_exp"] = False
 
-    # This call verifies the ext, iat, and nbf claims
-    # This optionally verifies the exp and aud claims if enabled
-    decoded_token = jwt.decode(
-        encoded_token,
-        secret,
-        algorithms=algorithms,
-        audience=audience,
-        issuer=issuer,
-        leeway=leeway,
-        options=options,
-    )
+    decoded_token = None
+    cache_key = None
+    can_use_cache = unverified_claims is not None and not allow_expired
+    if verified_cache is not None and verified_cache_size > 0 and can_use_cache:
+        cache_key = _verified_cache_key(
+            _token_digest(encoded_token),
+            secret,
+            algorithms,
+            audience,
+            issuer,
+            leeway,
+            verify_aud,
+            verify_sub,
+        )
+        if cache_key is not None and verified_cache.contains(cache_key, leeway):
+            # This exact token was already verified with these exact options and
+            # has not expired since, so skip the signature and claims checks and
+            # use the claims the caller already parsed out of it.
+            decoded_token = unverified_claims
+
+    if decoded_token is None:
+        # This call verifies the ext, iat, and nbf claims
+        # This optionally verifies the exp and aud claims if enabled
+        decoded_token = jwt.decode(
+            encoded_token,
+            secret,
+            algorithms=algorithms,
+            audience=audience,
+            issuer=issuer,
+            leeway=leeway,
+            options=options,
+        )
+        if verified_cache is not None and cache_key is not None:
+            # PyJWT accepts any exp which int() can convert, so store it the
+            # same way it was compared
+            exp = decoded_token.get("exp")
+            if exp is not None:
+                exp = int(exp)
+            verified_cache.add(cache_key, exp, verified_cache_size)
 
     # Make sure that any custom claims we expect in the token are present
     if identity_claim_key not in decoded_token:
         raise JWTDecodeError("Missing claim: {}".format(identity_claim_key))
 
-    if "type" not in decoded_token:
-        decoded_token["type"] = "access"
-
-    if "fresh" not in decoded_token:
-        decoded_token["fresh"] = False
-
-    if "jti" not in decoded_token:
-        decoded_token["jti"] = None
+    # Fill in defaults for optional claims this extension relies on
+    decoded_token.setdefault("type", "access")
+    decoded_token.setdefault("fresh", False)
+    decoded_token.setdefault("jti", None)
 
     if csrf_value:
         if "csrf" not in decoded_token:
@@ -266,6 +266,14 @@ def get_csrf_token(encoded_token: str) -> str:
     return token["csrf"]
 
 
+def _get_unverified_csrf_token(encoded_token: str) -> str:
+    # Used when setting cookies for a JWT that is about to be sent back to the
+    # client. It is fully verified when it comes back in a request, so skip the
+    # signature check here and just read the CSRF claim out of it.
+    token = jwt.decode(encoded_token, options={"verify_signature": False})
+    return token["csrf"]
+
+
 def set_access_cookies(
     response: Response, encoded_access_token: str, max_age=None, domain=None
 ) -> None:
@@ -292,27 +300,32 @@ def set_access_cookies(
         it will use this as the cookies ``domain`` and the JWT_COOKIE_DOMAIN option
         will be ignored.
     """
+    max_age = max_age or config.cookie_max_age
+    domain = domain or config.cookie_domain
+    secure = config.cookie_secure
+    samesite = config.cookie_samesite
+
     response.set_cookie(
         config.access_cookie_name,
         value=encoded_access_token,
-        max_age=max_age or config.cookie_max_age,
-        secure=config.cookie_secure,
+        max_age=max_age,
+        secure=secure,
         httponly=True,
-        domain=domain or config.cookie_domain,
+        domain=domain,
         path=config.access_cookie_path,
-        samesite=config.cookie_samesite,
+        samesite=samesite,
     )
 
     if config.cookie_csrf_protect and config.csrf_in_cookies:
         response.set_cookie(
             config.access_csrf_cookie_name,
-            value=get_csrf_token(encoded_access_token),
-            max_age=max_age or config.cookie_max_age,
-            secure=config.cookie_secure,
+            value=_get_unverified_csrf_token(encoded_access_token),
+            max_age=max_age,
+            secure=secure,
             httponly=False,
-            domain=domain or config.cookie_domain,
+            domain=domain,
             path=config.access_csrf_cookie_path,
-            samesite=config.cookie_samesite,
+            samesite=samesite,
         )
 
 
@@ -345,27 +358,32 @@ def set_refresh_cookies(
         it will use this as the cookies ``domain`` and the JWT_COOKIE_DOMAIN option
         will be ignored.
     """
+    max_age = max_age or config.cookie_max_age
+    domain = domain or config.cookie_domain
+    secure = config.cookie_secure
+    samesite = config.cookie_samesite
+
     response.set_cookie(
         config.refresh_cookie_name,
         value=encoded_refresh_token,
-        max_age=max_age or config.cookie_max_age,
-        secure=config.cookie_secure,
+        max_age=max_age,
+        secure=secure,
         httponly=True,
-        domain=domain or config.cookie_domain,
+        domain=domain,
         path=config.refresh_cookie_path,
-        samesite=config.cookie_samesite,
+        samesite=samesite,
     )
 
     if config.cookie_csrf_protect and config.csrf_in_cookies:
         response.set_cookie(
             config.refresh_csrf_cookie_name,
-            value=get_csrf_token(encoded_refresh_token),
-            max_age=max_age or config.cookie_max_age,
-            secure=config.cookie_secure,
+            value=_get_unverified_csrf_token(encoded_refresh_token),
+            max_age=max_age,
+            secure=secure,
             httponly=False,
-            domain=domain or config.cookie_domain,
+            domain=domain,
             path=config.refresh_csrf_cookie_path,
-            samesite=config.cookie_samesite,
+            samesite=samesite,
         )
 
 
@@ -395,15 +413,19 @@ def unset_access_cookies(response: Response, domain: Optional[str] = None) -> No
         it will use this as the cookies ``domain`` and the JWT_COOKIE_DOMAIN option
         will be ignored.
     """
+    domain = domain or config.cookie_domain
+    secure = config.cookie_secure
+    samesite = config.cookie_samesite
+
     response.set_cookie(
         config.access_cookie_name,
         value="",
         expires=0,
-        secure=config.cookie_secure,
+        secure=secure,
         httponly=True,
-        domain=domain or config.cookie_domain,
+        domain=domain,
         path=config.access_cookie_path,
-        samesite=config.cookie_samesite,
+        samesite=samesite,
     )
 
     if config.cookie_csrf_protect and config.csrf_in_cookies:
@@ -411,11 +433,11 @@ def unset_access_cookies(response: Response, domain: Optional[str] = None) -> No
             config.access_csrf_cookie_name,
             value="",
             expires=0,
-            secure=config.cookie_secure,
+            secure=secure,
             httponly=False,
-            domain=domain or config.cookie_domain,
+            domain=domain,
             path=config.access_csrf_cookie_path,
-            samesite=config.cookie_samesite,
+            samesite=samesite,
         )
 
 
@@ -433,15 +455,19 @@ def unset_refresh_cookies(response: Response, domain: Optional[str] = None) -> N
         it will use this as the cookies ``domain`` and the JWT_COOKIE_DOMAIN option
         will be ignored.
     """
+    domain = domain or config.cookie_domain
+    secure = config.cookie_secure
+    samesite = config.cookie_samesite
+
     response.set_cookie(
         config.refresh_cookie_name,
         value="",
         expires=0,
-        secure=config.cookie_secure,
+        secure=secure,
         httponly=True,
-        domain=domain or config.cookie_domain,
+        domain=domain,
         path=config.refresh_cookie_path,
-        samesite=config.cookie_samesite,
+        samesite=samesite,
     )
 
     if config.cookie_csrf_protect and config.csrf_in_cookies:
@@ -449,11 +475,11 @@ def unset_refresh_cookies(response: Response, domain: Optional[str] = None) -> N
             config.refresh_csrf_cookie_name,
             value="",
             expires=0,
-            secure=config.cookie_secure,
+            secure=secure,
             httponly=False,
-            domain=domain or config.cookie_domain,
+            domain=domain,
             path=config.refresh_csrf_cookie_path,
-            samesite=config.cookie_samesite,
+            samesite=samesite,
         )
 
 
@@ -1,7 +1,6 @@
-from datetime import datetime
-from datetime import timezone
+import re
 from functools import wraps
-from re import split
+from time import time
 from typing import Any
 from typing import Optional
 from typing import Sequence
@@ -21,15 +20,17 @@ from flask_jwt_extended.exceptions import InvalidQueryParamError
 from flask_jwt_extended.exceptions import NoAuthorizationError
 from flask_jwt_extended.exceptions import UserLookupError
 from flask_jwt_extended.internal_utils import custom_verification_for_token
+from flask_jwt_extended.internal_utils import get_jwt_manager
 from flask_jwt_extended.internal_utils import has_user_lookup
 from flask_jwt_extended.internal_utils import user_lookup
 from flask_jwt_extended.internal_utils import verify_token_not_blocklisted
 from flask_jwt_extended.internal_utils import verify_token_type
-from flask_jwt_extended.utils import decode_token
-from flask_jwt_extended.utils import get_unverified_jwt_headers
 
 LocationType = Union[str, Sequence, None]
 
+# Separates the field values in a comma delimited header
+_HEADER_FIELD_SEPARATOR = re.compile(r",\s*")
+
 
 def _verify_token_is_fresh(jwt_header: dict, jwt_data: dict) -> None:
     fresh = jwt_data["fresh"]
@@ -37,8 +38,7 @@ def _verify_token_is_fresh(jwt_header: dict, jwt_data: dict) -> None:
         if not fresh:
             raise FreshTokenRequired("Fresh token required", jwt_header, jwt_data)
     else:
-        now = datetime.timestamp(datetime.now(timezone.utc))
-        if fresh < now:
+        if fresh < time():
             raise FreshTokenRequired("Fresh token required", jwt_header, jwt_data)
 
 
@@ -161,6 +161,11 @@ def jwt_required(
         revocation status of the token will be checked.
     """
 
+    # Wrap a single location in a list up front, so decorated views don't
+    # allocate a new list on every request
+    if isinstance(locations, str):
+        locations = [locations]
+
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
@@ -201,16 +206,23 @@ def _decode_jwt_from_headers() -> Tuple[str, None]:
     # Also handle the fact that the header that can be comma delimited, ie
     # <HeaderName>: <field> <value>, <field> <value>, etc...
     if header_type:
-        field_values = split(r",\s*", auth_header)
-        jwt_headers = [s for s in field_values if s and s.split()[0] == header_type]
-        if len(jwt_headers) != 1:
+        if "," in auth_header:
+            field_values = _HEADER_FIELD_SEPARATOR.split(auth_header)
+            jwt_headers = [s for s in field_values if s and s.split()[0] == header_type]
+            found = len(jwt_headers) == 1
+            parts = jwt_headers[0].split() if found else []
+        else:
+            # Fast path for the common case of a single "<HeaderType> <JWT>" value
+            parts = auth_header.split()
+            found = parts[0] == header_type
+
+        if not found:
             msg = (
                 f"Missing '{header_type}' type in '{header_name}' header. "
                 f"Expected '{header_name}: {header_type} <JWT>'"
             )
             raise NoAuthorizationError(msg)
 
-        parts = jwt_headers[0].split()
         if len(parts) != 2:
             msg = (
                 f"Bad {header_name} header. "
@@ -233,18 +245,22 @@ def _decode_jwt_from_headers() -> Tuple[str, None]:
 def _decode_jwt_from_cookies(refresh: bool) -> Tuple[str, Optional[str]]:
     if refresh:
         cookie_key = config.refresh_cookie_name
-        csrf_header_key = config.refresh_csrf_header_name
-        csrf_field_key = config.refresh_csrf_field_name
     else:
         cookie_key = config.access_cookie_name
-        csrf_header_key = config.access_csrf_header_name
-        csrf_field_key = config.access_csrf_field_name
 
     encoded_token = request.cookies.get(cookie_key)
     if not encoded_token:
         raise NoAuthorizationError('Missing cookie "{}"'.format(cookie_key))
 
+    # Only look up the CSRF options when this request actually needs them
     if config.cookie_csrf_protect and request.method in config.csrf_request_methods:
+        if refresh:
+            csrf_header_key = config.refresh_csrf_header_name
+            csrf_field_key = config.refresh_csrf_field_name
+        else:
+            csrf_header_key = config.access_csrf_header_name
+            csrf_field_key = config.access_csrf_field_name
+
         csrf_value = request.headers.get(csrf_header_key, None)
         if not csrf_value and config.csrf_check_form:
             csrf_value = request.form.get(csrf_field_key, None)
@@ -295,6 +311,16 @@ def _decode_jwt_from_json(refresh: bool) -> Tuple[str, None]:
     return encoded_token, None
 
 
+# Functions to get the encoded JWT (and the CSRF value, if any) from each of the
+# supported locations. These are called with the ``refresh`` argument.
+_ENCODED_TOKEN_GETTERS = {
+    "cookies": _decode_jwt_from_cookies,
+    "headers": lambda refresh: _decode_jwt_from_headers(),
+    "json": _decode_jwt_from_json,
+    "query_string": lambda refresh: _decode_jwt_from_query_string(),
+}
+
+
 def _decode_jwt_from_request(
     locations: LocationType,
     fresh: bool,
@@ -309,37 +335,22 @@ def _decode_jwt_from_request(
     if not locations:
         locations = config.token_location
 
-    # Get the decode functions in the order specified by locations.
-    # Each entry in this list is a tuple (<location>, <encoded-token-function>)
-    get_encoded_token_functions = []
     for location in locations:
-        if location == "cookies":
-            get_encoded_token_functions.append(
-                (location, lambda: _decode_jwt_from_cookies(refresh))
-            )
-        elif location == "query_string":
-            get_encoded_token_functions.append(
-                (location, _decode_jwt_from_query_string)
-            )
-        elif location == "headers":
-            get_encoded_token_functions.append((location, _decode_jwt_from_headers))
-        elif location == "json":
-            get_encoded_token_functions.append(
-                (location, lambda: _decode_jwt_from_json(refresh))
-            )
-        else:
+        if location not in _ENCODED_TOKEN_GETTERS:
             raise RuntimeError(f"'{location}' is not a valid location")
 
     # Try to find the token from one of these locations. It only needs to exist
     # in one place to be valid (not every location).
+    jwt_manager = get_jwt_manager()
     errors = []
     decoded_token = None
-    for location, get_encoded_token_function in get_encoded_token_functions:
+    for location in locations:
         try:
-            encoded_token, csrf_token = get_encoded_token_function()
-            decoded_token = decode_token(encoded_token, csrf_token)
+            encoded_token, csrf_token = _ENCODED_TOKEN_GETTERS[location](refresh)
+            jwt_header, decoded_token = jwt_manager._decode_jwt_and_header_from_config(
+                encoded_token, csrf_token
+            )
             jwt_location = location
-            jwt_header = get_unverified_jwt_headers(encoded_token)
             break
         except NoAuthorizationError as e:
             errors.append(str(e))
@@ -6,6 +6,7 @@ from flask_jwt_extended import create_access_token
 from flask_jwt_extended import create_refresh_token
 from flask_jwt_extended import decode_token
 from flask_jwt_extended import get_jwt
+from flask_jwt_extended import get_unverified_jwt_headers
 from flask_jwt_extended import jwt_required
 from flask_jwt_extended import JWTManager
 from tests.utils import get_jwt_manager
@@ -159,3 +160,45 @@ def test_addition_claims_merge_tie_goes_to_create_access_token(app):
     response = test_client.get("/protected", headers=make_headers(access_token))
     assert response.get_json()["default"] == "foo"
     assert response.status_code == 200
+
+
+def test_additional_claims_loader_result_is_not_modified(app):
+    jwt = get_jwt_manager(app)
+    shared_claims = {"foo": "bar"}
+
+    @jwt.additional_claims_loader
+    def add_claims(identity):
+        return shared_claims
+
+    with app.test_request_context():
+        access_token = create_access_token("username", additional_claims={"a": 1})
+        assert decode_token(access_token)["a"] == 1
+        assert decode_token(access_token)["foo"] == "bar"
+
+        access_token = create_access_token("username", additional_claims={"b": 2})
+        decoded = decode_token(access_token)
+        assert decoded["b"] == 2
+        assert "a" not in decoded
+
+    assert shared_claims == {"foo": "bar"}
+
+
+def test_additional_headers_loader_result_is_not_modified(app):
+    jwt = get_jwt_manager(app)
+    shared_headers = {"foo": "bar"}
+
+    @jwt.additional_headers_loader
+    def add_headers(identity):
+        return shared_headers
+
+    with app.test_request_context():
+        access_token = create_access_token("username", additional_headers={"a": 1})
+        assert get_unverified_jwt_headers(access_token)["a"] == 1
+        assert get_unverified_jwt_headers(access_token)["foo"] == "bar"
+
+        access_token = create_access_token("username", additional_headers={"b": 2})
+        headers = get_unverified_jwt_headers(access_token)
+        assert headers["b"] == 2
+        assert "a" not in headers
+
+    assert shared_headers == {"foo": "bar"}
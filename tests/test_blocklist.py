@@ -39,8 +39,7 @@ def app():
     return app
 
 
-@pytest.mark.parametrize("blocklist_type", [["access"], ["refresh", "access"]])
-def test_blocklisted_access_token_revocation_skip(app, blocklist_type):
+def test_blocklisted_access_token_revocation_skip(app):
     jwt = get_jwt_manager(app)
 
     @jwt.token_in_blocklist_loader
@@ -60,8 +59,7 @@ def test_blocklisted_access_token_revocation_skip(app, blocklist_type):
     assert response.status_code == 200
 
 
-@pytest.mark.parametrize("blocklist_type", [["access"], ["refresh", "access"]])
-def test_blocklisted_access_token_revocation_no_skip(app, blocklist_type):
+def test_blocklisted_access_token_revocation_no_skip(app):
     jwt = get_jwt_manager(app)
 
     @jwt.token_in_blocklist_loader
@@ -81,8 +79,7 @@ def test_blocklisted_access_token_revocation_no_skip(app, blocklist_type):
     assert response.status_code == 401
 
 
-@pytest.mark.parametrize("blocklist_type", [["access"], ["refresh", "access"]])
-def test_non_blocklisted_access_token(app, blocklist_type):
+def test_non_blocklisted_access_token(app):
     jwt = get_jwt_manager(app)
 
     @jwt.token_in_blocklist_loader
@@ -100,8 +97,7 @@ def test_non_blocklisted_access_token(app, blocklist_type):
     assert response.status_code == 200
 
 
-@pytest.mark.parametrize("blocklist_type", [["access"], ["refresh", "access"]])
-def test_blocklisted_access_token(app, blocklist_type):
+def test_blocklisted_access_token(app):
     jwt = get_jwt_manager(app)
 
     @jwt.token_in_blocklist_loader
@@ -117,8 +113,7 @@ def test_blocklisted_access_token(app, blocklist_type):
     assert response.status_code == 401
 
 
-@pytest.mark.parametrize("blocklist_type", [["refresh"], ["refresh", "access"]])
-def test_non_blocklisted_refresh_token(app, blocklist_type):
+def test_non_blocklisted_refresh_token(app):
     jwt = get_jwt_manager(app)
 
     @jwt.token_in_blocklist_loader
@@ -136,8 +131,7 @@ def test_non_blocklisted_refresh_token(app, blocklist_type):
     assert response.status_code == 200
 
 
-@pytest.mark.parametrize("blocklist_type", [["refresh"], ["refresh", "access"]])
-def test_blocklisted_refresh_token(app, blocklist_type):
+def test_blocklisted_refresh_token(app):
     jwt = get_jwt_manager(app)
 
     @jwt.token_in_blocklist_loader
@@ -66,6 +66,7 @@ def test_default_configs(app):
         assert config.refresh_expires == timedelta(days=30)
         assert config.algorithm == "HS256"
         assert config.decode_algorithms == ["HS256"]
+        assert config.decode_cache_size == 1024
         assert config.is_asymmetric is False
 
         assert config.cookie_max_age is None
@@ -5,6 +5,7 @@ from flask import request
 
 from flask_jwt_extended import create_access_token
 from flask_jwt_extended import create_refresh_token
+from flask_jwt_extended import get_csrf_token
 from flask_jwt_extended import jwt_required
 from flask_jwt_extended import JWTManager
 from flask_jwt_extended import set_access_cookies
@@ -170,6 +171,20 @@ def test_default_access_csrf_protection(app, options):
     assert response.get_json() == {"foo": "bar"}
 
 
+def test_csrf_cookie_matches_get_csrf_token(app):
+    with app.test_request_context():
+        access_token = create_access_token("username")
+        refresh_token = create_refresh_token("username")
+        response = jsonify(login=True)
+        set_access_cookies(response, access_token)
+        set_refresh_cookies(response, refresh_token)
+
+        access_csrf = _get_cookie_from_response(response, "csrf_access_token")
+        refresh_csrf = _get_cookie_from_response(response, "csrf_refresh_token")
+        assert access_csrf["csrf_access_token"] == get_csrf_token(access_token)
+        assert refresh_csrf["csrf_refresh_token"] == get_csrf_token(refresh_token)
+
+
 @pytest.mark.parametrize(
     "options",
     [
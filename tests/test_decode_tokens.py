@@ -1,7 +1,9 @@
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from time import time
 
+import jwt
 import pytest
 from dateutil.relativedelta import relativedelta
 from flask import Flask
@@ -21,7 +23,9 @@ from flask_jwt_extended import get_jti
 from flask_jwt_extended import get_unverified_jwt_headers
 from flask_jwt_extended import JWTManager
 from flask_jwt_extended.config import config
+from flask_jwt_extended.exceptions import CSRFError
 from flask_jwt_extended.exceptions import JWTDecodeError
+from flask_jwt_extended.tokens import _VerifiedTokenCache
 from tests.utils import encode_token
 from tests.utils import get_jwt_manager
 
@@ -395,3 +399,123 @@ def test_disable_nbf_encoding(app):
         access_token = create_access_token("username", fresh=True)
         decoded = decode_token(access_token)
         assert "nbf" not in decoded
+
+
+def test_verified_token_cache(app, default_access_token):
+    jwtM = get_jwt_manager(app)
+    token = encode_token(app, default_access_token)
+
+    with app.test_request_context():
+        first = decode_token(token, csrf_value="abcd")
+        assert len(jwtM._verified_token_cache) == 1
+
+        second = decode_token(token, csrf_value="abcd")
+        assert second == first
+        assert second is not first
+        assert len(jwtM._verified_token_cache) == 1
+
+        # CSRF is still checked when the token is served from the cache
+        with pytest.raises(CSRFError):
+            decode_token(token, csrf_value="wrong")
+        assert len(jwtM._verified_token_cache) == 1
+
+
+def test_verified_token_cache_hit_does_not_decode_again(
+    app, default_access_token, monkeypatch
+):
+    token = encode_token(app, default_access_token)
+
+    with app.test_request_context():
+        first = decode_token(token, csrf_value="abcd")
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("jwt.decode called on a cache hit")
+
+        monkeypatch.setattr(jwt, "decode", fail_decode)
+        assert decode_token(token, csrf_value="abcd") == first
+
+
+def test_verified_token_cache_respects_decode_options(app, default_access_token):
+    default_access_token["aud"] = "foo"
+    token = encode_token(app, default_access_token)
+
+    with app.test_request_context():
+        app.config["JWT_DECODE_AUDIENCE"] = ["foo"]
+        decode_token(token)
+
+        app.config["JWT_DECODE_AUDIENCE"] = ["bar"]
+        with pytest.raises(InvalidAudienceError):
+            decode_token(token)
+
+        app.config["JWT_SECRET_KEY"] = "something_else"
+        app.config["JWT_DECODE_AUDIENCE"] = ["foo"]
+        with pytest.raises(InvalidSignatureError):
+            decode_token(token)
+
+
+def test_verified_token_cache_expiration():
+    cache = _VerifiedTokenCache()
+    now = time()
+
+    cache.add("valid", now + 60, maxsize=10)
+    cache.add("no_exp", None, maxsize=10)
+    cache.add("expired", now - 5, maxsize=10)
+    assert cache.contains("valid", leeway=0)
+    assert cache.contains("no_exp", leeway=0)
+    assert cache.contains("expired", leeway=timedelta(seconds=10))
+    assert len(cache) == 3
+
+    # An entry which has expired is dropped, so the token is fully verified
+    assert not cache.contains("expired", leeway=0)
+    assert not cache.contains("expired", leeway=timedelta(seconds=10))
+    assert len(cache) == 2
+
+
+def test_verified_token_cache_eviction():
+    cache = _VerifiedTokenCache()
+    cache.add("a", None, maxsize=2)
+    cache.add("b", None, maxsize=2)
+
+    # Looking up an entry marks it as the most recently used
+    assert cache.contains("a", leeway=0)
+    cache.add("c", None, maxsize=2)
+    assert len(cache) == 2
+    assert cache.contains("a", leeway=0)
+    assert cache.contains("c", leeway=0)
+    assert not cache.contains("b", leeway=0)
+
+
+def test_verified_token_cache_with_string_exp(app):
+    jwtM = get_jwt_manager(app)
+
+    with app.test_request_context():
+        token = create_access_token("username", additional_claims={"exp": "9999999999"})
+        first = decode_token(token)
+        second = decode_token(token)
+        assert second == first
+        assert len(jwtM._verified_token_cache) == 1
+
+
+def test_verified_token_cache_size(app):
+    jwtM = get_jwt_manager(app)
+    app.config["JWT_DECODE_CACHE_SIZE"] = 2
+
+    with app.test_request_context():
+        for _ in range(3):
+            decode_token(create_access_token("username"))
+        assert len(jwtM._verified_token_cache) == 2
+
+        jwtM._verified_token_cache.clear()
+        app.config["JWT_DECODE_CACHE_SIZE"] = 0
+        decode_token(create_access_token("username"))
+        assert len(jwtM._verified_token_cache) == 0
+
+
+def test_verified_token_cache_with_unhashable_key(app):
+    jwtM = get_jwt_manager(app)
+    app.config["JWT_DECODE_AUDIENCE"] = [{"not": "hashable"}, "foo"]
+
+    with app.test_request_context():
+        token = create_access_token("username", additional_claims={"aud": "foo"})
+        decode_token(token)
+        assert len(jwtM._verified_token_cache) == 0
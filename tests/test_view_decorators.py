@@ -274,14 +274,19 @@ def test_override_jwt_location(app):
     def protected_invalid():
         return jsonify(foo="bar")
 
+    @app.route("/verify_other")
+    def verify_other():
+        verify_jwt_in_request(locations="headers")
+        return jsonify(foo="bar")
+
     test_client = app.test_client()
     with app.test_request_context():
         access_token = create_access_token("username")
 
-    url = "/protected_other"
-    response = test_client.get(url, headers=make_headers(access_token))
-    assert response.get_json() == {"foo": "bar"}
-    assert response.status_code == 200
+    for url in ("/protected_other", "/verify_other"):
+        response = test_client.get(url, headers=make_headers(access_token))
+        assert response.get_json() == {"foo": "bar"}
+        assert response.status_code == 200
 
     url = "/protected"
     response = test_client.get(url, headers=make_headers(access_token))